@@ -1800,9 +1800,12 @@ class IndexedFrame(Frame):
                 "user defined function compilation failed."
             ) from e
 
-        # Mask and data column preallocated
+        # Mask and data column preallocated. The kernel sets the bits of
+        # the valid rows directly in an all-null libcudf bitmask
         ans_col = cp.empty(len(self), dtype=retty)
-        ans_mask = cudf.core.column.column_empty(len(self), dtype="bool")
+        ans_mask = libcudf.null_mask.create_null_mask(
+            len(self), state=libcudf.null_mask.MaskState.ALL_NULL
+        )
         launch_args = [(ans_col, ans_mask), len(self)]
         offsets = []
 
@@ -1825,7 +1828,7 @@ class IndexedFrame(Frame):
             raise RuntimeError("UDF kernel execution failed.") from e
 
         col = cudf.core.column.as_column(ans_col)
-        col.set_base_mask(libcudf.transform.bools_to_mask(ans_mask))
+        col.set_base_mask(ans_mask)
         result = cudf.Series._from_data({None: col}, self._index)
 
         return result
@@ -2,8 +2,7 @@
 
 import operator
 
-from llvmlite import ir
-from numba.core import cgutils
+from numba.core import cgutils, compiler
 from numba.core.typing import signature as nb_signature
 from numba.cuda.cudaimpl import (
     lower as cuda_lower,
@@ -18,7 +17,7 @@ from cudf.core.udf._ops import (
     comparison_ops,
     unary_ops,
 )
-from cudf.core.udf.typing import MaskedType, NAType
+from cudf.core.udf.typing import SUPPORTED_NUMBA_TYPES, MaskedType, NAType
 
 
 @cuda_lowering_registry.lower_constant(NAType)
@@ -34,11 +33,111 @@ def constant_na(context, builder, ty, pyval):
 # we can involve both validities in constructing the answer
 
 
+# Binary ops that are safe to compute whatever values the operands of
+# a null result hold. Division, modulo and power may raise for some
+# inputs, so those are only computed when both operands are valid
+_UNGUARDED_OPS = frozenset(
+    [operator.add, operator.sub, operator.mul, *bitwise_ops, *comparison_ops]
+)
+
+
+def _binary_op_impl(op):
+    """
+    Make the function that applies `op` to two primitive values,
+    which the lowerings compile with `_compile_inline`.
+
+    Numba caches internally compiled functions by their code object,
+    signature and closure contents. Defining the function once here
+    for every binary op family means that e.g. `Masked + Masked` and
+    `Masked + scalar` reuse a single compiled `add` for the same
+    primitive types.
+    """
+    return lambda x, y: op(x, y)
+
+
+def _unary_op_impl(op):
+    """
+    Make the function that applies `op` to a primitive value,
+    which the lowerings compile with `_compile_inline`.
+    """
+    return lambda x: op(x)
+
+
+def _compile_inline(context, builder, impl, sig, args):
+    """
+    Like `context.compile_internal`, but marks the compiled function
+    `alwaysinline` so that NVVM folds the tiny op function into the
+    caller instead of emitting a device function call for it.
+    """
+    flags = compiler.Flags()
+    flags.no_compile = True
+    flags.no_cpython_wrapper = True
+    flags.no_cfunc_wrapper = True
+    flags.forceinline = True
+    cres = context.compile_subroutine(builder, impl, sig, flags=flags)
+    return context.call_internal(builder, cres.fndesc, sig, args)
+
+
+# llvmlite builder methods that implement an op between two integers
+# or two floats of the same type, as numba itself lowers them
+_INT_OPS = {
+    operator.add: "add",
+    operator.sub: "sub",
+    operator.mul: "mul",
+    operator.and_: "and_",
+    operator.or_: "or_",
+    operator.xor: "xor",
+}
+_FLOAT_OPS = {
+    operator.add: "fadd",
+    operator.sub: "fsub",
+    operator.mul: "fmul",
+}
+_COMPARISON_PREDICATES = {
+    operator.eq: "==",
+    operator.ne: "!=",
+    operator.lt: "<",
+    operator.le: "<=",
+    operator.gt: ">",
+    operator.ge: ">=",
+}
+
+
+def _lower_binary_op(context, builder, op, op_impl, sig, args):
+    """
+    Lower `op` between two primitive values. When both operands share
+    an integer or float type, comparisons and simple ops returning
+    that same type are a single instruction that is emitted directly.
+    Everything else compiles `op_impl` and lets numba handle e.g.
+    mixed type promotion.
+    """
+    ty = sig.args[0]
+    if ty == sig.args[1]:
+        if op in _COMPARISON_PREDICATES:
+            predicate = _COMPARISON_PREDICATES[op]
+            if isinstance(ty, types.Integer):
+                if ty.signed:
+                    return builder.icmp_signed(predicate, *args)
+                return builder.icmp_unsigned(predicate, *args)
+            if isinstance(ty, types.Float):
+                # NaN compares unequal to everything, including itself
+                if op is operator.ne:
+                    return builder.fcmp_unordered(predicate, *args)
+                return builder.fcmp_ordered(predicate, *args)
+        elif ty == sig.return_type:
+            if isinstance(ty, types.Integer) and op in _INT_OPS:
+                return getattr(builder, _INT_OPS[op])(*args)
+            if isinstance(ty, types.Float) and op in _FLOAT_OPS:
+                return getattr(builder, _FLOAT_OPS[op])(*args)
+    return _compile_inline(context, builder, op_impl, sig, args)
+
+
 def make_arithmetic_op(op):
     """
     Make closures that implement arithmetic operations. See
     register_arithmetic_op for details.
     """
+    op_impl = _binary_op_impl(op)
 
     def masked_scalar_op_impl(context, builder, sig, args):
         """
@@ -66,20 +165,32 @@ def make_arithmetic_op(op):
         # compute output validity
         valid = builder.and_(m1.valid, m2.valid)
         result.valid = valid
-        with builder.if_then(valid):
-            # Let numba handle generating the extra IR needed to perform
-            # operations on mixed types, by compiling the final core op between
-            # the two primitive values as a separate function and calling it
-            result.value = context.compile_internal(
-                builder,
-                lambda x, y: op(x, y),
-                nb_signature(
-                    masked_return_type.value_type,
-                    masked_type_1.value_type,
-                    masked_type_2.value_type,
-                ),
-                (m1.value, m2.value),
+
+        # Same-type integer/float ops are emitted directly; anything else
+        # lets numba generate the extra IR needed for mixed types by
+        # compiling the core op with `_compile_inline` and inlining it
+        nb_sig = nb_signature(
+            masked_return_type.value_type,
+            masked_type_1.value_type,
+            masked_type_2.value_type,
+        )
+        compile_args = (m1.value, m2.value)
+        if op in _UNGUARDED_OPS:
+            # compute unconditionally and select the result rather than
+            # branching on validity. A null result keeps a zeroed value
+            computed = _lower_binary_op(
+                context, builder, op, op_impl, nb_sig, compile_args
+            )
+            result.value = builder.select(
+                valid,
+                computed,
+                context.get_constant_null(masked_return_type.value_type),
             )
+        else:
+            with builder.if_then(valid):
+                result.value = _lower_binary_op(
+                    context, builder, op, op_impl, nb_sig, compile_args
+                )
         return result._getvalue()
 
     return masked_scalar_op_impl
@@ -90,6 +201,7 @@ def make_unary_op(op):
     Make closures that implement unary operations. See register_unary_op for
     details.
     """
+    op_impl = _unary_op_impl(op)
 
     def masked_scalar_unary_op_impl(context, builder, sig, args):
         """
@@ -112,12 +224,12 @@ def make_unary_op(op):
         # compute output validity
         result.valid = m1.valid
         with builder.if_then(m1.valid):
-            # Let numba handle generating the extra IR needed to perform
-            # operations on mixed types, by compiling the final core op between
-            # the two primitive values as a separate function and calling it
-            result.value = context.compile_internal(
+            # Let numba generate the IR for the core op, compiled with
+            # `_compile_inline` so it is inlined into the caller
+            result.value = _compile_inline(
+                context,
                 builder,
-                lambda x: op(x),
+                op_impl,
                 nb_signature(
                     masked_return_type.value_type,
                     masked_type_1.value_type,
@@ -135,9 +247,9 @@ def register_arithmetic_op(op):
     arithmetic op `op`.
 
     Because the lowering implementations compile the final
-    op separately using a lambda and compile_internal, `op`
-    needs to be tied to each lowering implementation using
-    a closure.
+    op from `_binary_op_impl` with `_compile_inline` (or emit
+    it directly), `op` needs to be tied to each lowering
+    implementation using a closure.
 
     This function makes and lowers a closure for one op.
 
@@ -152,7 +264,7 @@ def register_unary_op(op):
     unary op `op`.
 
     Because the lowering implementations compile the final
-    op separately using a lambda and compile_internal, `op`
+    op from `_unary_op_impl` with `_compile_inline`, `op`
     needs to be tied to each lowering implementation using
     a closure.
 
@@ -171,47 +283,47 @@ def masked_scalar_null_op_impl(context, builder, sig, args):
     needs to take place
     """
 
-    return_type = sig.return_type  # MaskedType(...)
-    result = cgutils.create_struct_proxy(MaskedType(return_type.value_type))(
-        context, builder
-    )
+    # An all zero struct is invalid, and is a single constant rather
+    # than a freshly built struct
+    return context.get_constant_null(sig.return_type)
 
-    # Invalidate the struct and leave `value` uninitialized
-    result.valid = context.get_constant(types.boolean, 0)
-    return result._getvalue()
+
+def _masked_struct_unpack(context, builder, sig, args):
+    """
+    For a binary op between a `MaskedType` and some other type, in
+    either order, return the position of the `MaskedType` operand
+    along with a struct proxy over its value.
+    """
+    masked_idx = 0 if isinstance(sig.args[0], MaskedType) else 1
+    indata = cgutils.create_struct_proxy(sig.args[masked_idx])(
+        context, builder, value=args[masked_idx]
+    )
+    return masked_idx, indata
 
 
 def make_const_op(op):
+    op_impl = _binary_op_impl(op)
+
     def masked_scalar_const_op_impl(context, builder, sig, args):
         return_type = sig.return_type
         result = cgutils.create_struct_proxy(return_type)(context, builder)
-        result.valid = context.get_constant(types.boolean, 0)
-        if isinstance(sig.args[0], MaskedType):
-            masked_type, const_type = sig.args
-            masked_value, const_value = args
+        result.valid = cgutils.false_bit
+
+        masked_idx, indata = _masked_struct_unpack(context, builder, sig, args)
+
+        # the op is compiled against the primitive value in place of
+        # the `MaskedType` operand, keeping the operand order intact
+        arg_types = list(sig.args)
+        arg_types[masked_idx] = arg_types[masked_idx].value_type
+        compile_args = list(args)
+        compile_args[masked_idx] = indata.value
+        nb_sig = nb_signature(return_type.value_type, *arg_types)
 
-            indata = cgutils.create_struct_proxy(masked_type)(
-                context, builder, value=masked_value
-            )
-            nb_sig = nb_signature(
-                return_type.value_type, masked_type.value_type, const_type
-            )
-            compile_args = (indata.value, const_value)
-        else:
-            const_type, masked_type = sig.args
-            const_value, masked_value = args
-            indata = cgutils.create_struct_proxy(masked_type)(
-                context, builder, value=masked_value
-            )
-            nb_sig = nb_signature(
-                return_type.value_type, const_type, masked_type.value_type
-            )
-            compile_args = (const_value, indata.value)
         with builder.if_then(indata.valid):
-            result.value = context.compile_internal(
-                builder, lambda x, y: op(x, y), nb_sig, compile_args
+            result.value = _lower_binary_op(
+                context, builder, op, op_impl, nb_sig, compile_args
             )
-            result.valid = context.get_constant(types.boolean, 1)
+            result.valid = cgutils.true_bit
         return result._getvalue()
 
     return masked_scalar_const_op_impl
@@ -219,14 +331,9 @@ def make_const_op(op):
 
 def register_const_op(op):
     to_lower_op = make_const_op(op)
-    cuda_lower(op, MaskedType, types.Number)(to_lower_op)
-    cuda_lower(op, types.Number, MaskedType)(to_lower_op)
-    cuda_lower(op, MaskedType, types.Boolean)(to_lower_op)
-    cuda_lower(op, types.Boolean, MaskedType)(to_lower_op)
-    cuda_lower(op, MaskedType, types.NPDatetime)(to_lower_op)
-    cuda_lower(op, types.NPDatetime, MaskedType)(to_lower_op)
-    cuda_lower(op, MaskedType, types.NPTimedelta)(to_lower_op)
-    cuda_lower(op, types.NPTimedelta, MaskedType)(to_lower_op)
+    for scalar_type in SUPPORTED_NUMBA_TYPES:
+        cuda_lower(op, MaskedType, scalar_type)(to_lower_op)
+        cuda_lower(op, scalar_type, MaskedType)(to_lower_op)
 
 
 # register all lowering at init
@@ -248,24 +355,8 @@ def masked_scalar_is_null_impl(context, builder, sig, args):
     """
     Implement `MaskedType` is `NA`
     """
-    if isinstance(sig.args[1], NAType):
-        masked_type, na = sig.args
-        value = args[0]
-    else:
-        na, masked_type = sig.args
-        value = args[1]
-
-    indata = cgutils.create_struct_proxy(masked_type)(
-        context, builder, value=value
-    )
-    result = cgutils.alloca_once(builder, ir.IntType(1))
-    with builder.if_else(indata.valid) as (then, otherwise):
-        with then:
-            builder.store(context.get_constant(types.boolean, 0), result)
-        with otherwise:
-            builder.store(context.get_constant(types.boolean, 1), result)
-
-    return builder.load(result)
+    _, indata = _masked_struct_unpack(context, builder, sig, args)
+    return builder.not_(indata.valid)
 
 
 # Main kernel always calls `pack_return` on whatever the user defined
@@ -276,18 +367,18 @@ def pack_return_masked_impl(context, builder, sig, args):
     return args[0]
 
 
-@cuda_lower(api.pack_return, types.Boolean)
-@cuda_lower(api.pack_return, types.Number)
-@cuda_lower(api.pack_return, types.NPDatetime)
-@cuda_lower(api.pack_return, types.NPTimedelta)
 def pack_return_scalar_impl(context, builder, sig, args):
     outdata = cgutils.create_struct_proxy(sig.return_type)(context, builder)
     outdata.value = args[0]
-    outdata.valid = context.get_constant(types.boolean, 1)
+    outdata.valid = cgutils.true_bit
 
     return outdata._getvalue()
 
 
+for scalar_type in SUPPORTED_NUMBA_TYPES:
+    cuda_lower(api.pack_return, scalar_type)(pack_return_scalar_impl)
+
+
 @cuda_lower(operator.truth, MaskedType)
 def masked_scalar_truth_impl(context, builder, sig, args):
     indata = cgutils.create_struct_proxy(MaskedType(types.boolean))(
@@ -312,16 +403,13 @@ def cast_primitive_to_masked(context, builder, fromty, toty, val):
     casted = context.cast(builder, val, fromty, toty.value_type)
     ext = cgutils.create_struct_proxy(toty)(context, builder)
     ext.value = casted
-    ext.valid = context.get_constant(types.boolean, 1)
+    ext.valid = cgutils.true_bit
     return ext._getvalue()
 
 
 @cuda_lowering_registry.lower_cast(NAType, MaskedType)
 def cast_na_to_masked(context, builder, fromty, toty, val):
-    result = cgutils.create_struct_proxy(toty)(context, builder)
-    result.valid = context.get_constant(types.boolean, 0)
-
-    return result._getvalue()
+    return context.get_constant_null(toty)
 
 
 @cuda_lowering_registry.lower_cast(MaskedType, MaskedType)
@@ -20,6 +20,7 @@ from cudf.core.udf.utils import (
     _get_kernel,
     _get_udf_return_type,
     _mask_get,
+    _mask_set,
     _supported_cols_from_frame,
     _supported_dtypes_from_frame,
 )
@@ -143,6 +144,7 @@ def _get_row_kernel(frame, func, args):
         "cuda": cuda,
         "Masked": Masked,
         "_mask_get": _mask_get,
+        "_mask_set": _mask_set,
         "pack_return": pack_return,
         "row_type": row_type,
     }
@@ -7,7 +7,7 @@ import numpy as np
 from numba import cuda, typeof
 from numba.core.errors import TypingError
 from numba.np import numpy_support
-from numba.types import Poison, Tuple, boolean, int64, void
+from numba.types import Poison, Tuple, int64, void
 
 from cudf.core.dtypes import CategoricalDtype
 from cudf.core.udf.typing import MaskedType
@@ -130,8 +130,8 @@ def _construct_signature(frame, return_type, args):
     and offsets. Skips columns with unsupported dtypes.
     """
 
-    # Tuple of arrays, first the output data array, then the mask
-    return_type = Tuple((return_type[::1], boolean[::1]))
+    # Tuple of arrays, first the output data array, then the bitmask
+    return_type = Tuple((return_type[::1], libcudf_bitmask_type[::1]))
     offsets = []
     sig = [return_type, int64]
     for col in _supported_cols_from_frame(frame).values():
@@ -150,6 +150,12 @@ def _mask_get(mask, pos):
     return (mask[pos // MASK_BITSIZE] >> (pos % MASK_BITSIZE)) & 1
 
 
+@cuda.jit(device=True)
+def _mask_set(mask, pos):
+    """Set the validity bit of mask[pos]. Rows share words, so atomically."""
+    cuda.atomic.or_(mask, pos // MASK_BITSIZE, 1 << (pos % MASK_BITSIZE))
+
+
 def _generate_cache_key(frame, func: Callable):
     """Create a cache key that uniquely identifies a compilation.
 
@@ -3,6 +3,7 @@ import math
 import operator
 
 import numpy as np
+import pandas as pd
 import pytest
 from numba import cuda
 
@@ -40,6 +41,12 @@ def run_masked_udf_series(func, data, args=(), **kwargs):
     assert_eq(expect, obtain, **kwargs)
 
 
+# Null rows for a 150 row input, so the result mask spans five 32 bit
+# words. Nulls land on both sides of several word boundaries while
+# row 31, the highest bit of the first word, stays valid
+_spread_null_rows = [0, 5, 30, 32, 33, 63, 64, 100, 127, 128, 149]
+
+
 @pytest.mark.parametrize("op", arith_ops)
 def test_arith_masked_vs_masked(op):
     # This test should test all the typing
@@ -133,6 +140,53 @@ def test_compare_masked_vs_masked(op):
     run_masked_udf_test(func, gdf, check_dtype=False)
 
 
+@pytest.mark.parametrize("op", comparison_ops)
+def test_compare_masked_vs_masked_unsigned(op):
+    # values above 2**63 compare differently if treated as signed
+    def func(row):
+        x = row["a"]
+        y = row["b"]
+        return op(x, y)
+
+    gdf = cudf.DataFrame(
+        {
+            "a": cudf.Series(
+                [2**63 + 5, 1, 2**64 - 1, 7, None, 2**63], dtype="uint64"
+            ),
+            "b": cudf.Series(
+                [1, 2**63 + 5, 2**64 - 1, None, 3, 2**63 - 1],
+                dtype="uint64",
+            ),
+        }
+    )
+    run_masked_udf_test(func, gdf, check_dtype=False)
+
+
+@pytest.mark.parametrize("op", comparison_ops)
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_compare_masked_vs_masked_nan(op, dtype):
+    # NaN compares false against everything, including itself,
+    # except under `!=`
+    def func(row):
+        x = row["a"]
+        y = row["b"]
+        return op(x, y)
+
+    pdf = pd.DataFrame(
+        {
+            "a": [1.5, np.nan, np.nan, 2.0, -np.inf, 0.0],
+            "b": [1.5, 1.0, np.nan, np.nan, 0.0, -0.0],
+        },
+        dtype=dtype,
+    )
+    # keep the NaNs as values rather than turning them into nulls
+    gdf = cudf.from_pandas(pdf, nan_as_null=False)
+
+    expect = pdf.apply(func, axis=1)
+    obtain = gdf.apply(func, axis=1)
+    assert_eq(expect, obtain, check_dtype=False)
+
+
 @pytest.mark.parametrize("op", arith_ops)
 @pytest.mark.parametrize("constant", [1, 1.5, True, False])
 @pytest.mark.parametrize("data", [[1, 2, cudf.NA]])
@@ -363,6 +417,35 @@ def test_apply_everything():
     run_masked_udf_test(func, gdf, check_dtype=False)
 
 
+@pytest.mark.parametrize(
+    "null_rows", [_spread_null_rows, [], list(range(150))]
+)
+@pytest.mark.parametrize("start", [0, 37])
+def test_apply_result_mask_spans_words(null_rows, start):
+    """
+    Test that the validity of each output row lands in the right bit
+    of the result mask, for all valid, all null and mixed results and
+    for sliced input columns with a non-zero offset
+    """
+
+    def func(row):
+        x = row["a"]
+        y = row["b"]
+        return x + y
+
+    size = 150
+    gdf = cudf.DataFrame(
+        {
+            "a": cudf.Series(
+                [None if i in null_rows else i for i in range(size)],
+                dtype="int64",
+            ),
+            "b": cudf.Series(range(size), dtype="int64"),
+        }
+    )
+    run_masked_udf_test(func, gdf.iloc[start:], check_dtype=False)
+
+
 ###
 
 
@@ -391,6 +474,21 @@ def test_series_apply_null_conditional():
     run_masked_udf_series(func, data)
 
 
+@pytest.mark.parametrize(
+    "null_rows", [_spread_null_rows, [], list(range(150))]
+)
+@pytest.mark.parametrize("start", [0, 37])
+def test_series_apply_result_mask_spans_words(null_rows, start):
+    def func(x):
+        return x + 1
+
+    size = 150
+    data = cudf.Series(
+        [None if i in null_rows else i for i in range(size)], dtype="int64"
+    )
+    run_masked_udf_series(func, data.iloc[start:], check_dtype=False)
+
+
 ###
 
 